@@ -0,0 +1,635 @@
+"""
+Asyncio tools for interacting with LMS player (client) devices
+
+Requires the optional ``aiohttp`` dependency (``pip install PyLMSTools[async]``).
+"""
+
+import asyncio
+import logging
+from typing import List
+import aiohttp
+from pylmstools.player import (COMMANDS, DETAILED_TAGS, QUERIES, STATE_TAGS, LMSPlayerBase,
+                                _float_or, _int_or)
+from pylmstools.tags import LMSTags
+from pylmstools.server import LMSConnectionError, LMSServerError
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncLMSPlayer(LMSPlayerBase):
+    """
+    Asynchronous counterpart of :class:`pylmstools.player.LMSPlayer`.
+
+    Command building and response parsing are shared with LMSPlayer through
+    :class:`pylmstools.player.LMSPlayerBase`; this class only sends the requests.
+
+    Requests are sent with an ``aiohttp.ClientSession`` so that independent
+    queries can be issued concurrently. As ``__init__`` cannot await the server,
+    instances should be created with :meth:`create`:
+
+    .. code-block:: python
+
+        server = LMSServer("192.168.0.1")
+
+        async with await AsyncLMSPlayer.create("12:34:56:78:90:AB", server) as player:
+            await player.play()
+            elapsed, duration = await player.track_elapsed_and_duration()
+
+    Getters that are properties on LMSPlayer are coroutine methods here and
+    setters are ``set_`` prefixed coroutines (e.g. ``await player.set_volume(50)``).
+
+    If no session is provided, the player creates one on first use and closes
+    it in :meth:`close`.
+    """
+
+    def __init__(self, ref, server, session=None):
+        self.server = server
+        self.ref = ref
+        self._session = session
+        self._owns_session = session is None
+        self._inflight = {}
+        self._name = None
+        self._model = None
+        self._ip = None
+
+    @classmethod
+    async def create(cls, ref, server, session=None):
+        """
+        Create an instance of AsyncLMSPlayer and retrieve basic info about the player.
+
+        :rtype: AsyncLMSPlayer
+        :returns: Instance of squeezeplayer
+        """
+        player = cls(ref, server, session=session)
+        await player.update()
+        return player
+
+    @classmethod
+    async def from_index(cls, index, server, session=None):
+        """
+        Create an instance of AsyncLMSPlayer when the MAC address of the player is unknown.
+
+        This class method uses the index of the player (as registered on the server)
+        to identify the player.
+
+        :rtype: AsyncLMSPlayer
+        :returns: Instance of squeezeplayer
+        """
+        # Server level request, so the player is created without a reference
+        player = cls("", server, session=session)
+        player.ref = (await player.request(["player", "id", index, "?"]))["_id"]
+        await player.update()
+        return player
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        :rtype: aiohttp.ClientSession
+        :returns: session used for requests to the server
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session if it was created by this player."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def update(self):
+        """
+        Retrieve some basic info about the player.
+
+        Retrieves the name, model and ip attributes concurrently.
+        """
+        self._name, self._model, self._ip = await asyncio.gather(
+            self.parse_request(*QUERIES["name"]),
+            self.parse_request(*QUERIES["model"]),
+            self.parse_request(*QUERIES["ip"]))
+
+    async def request(self, command):
+        """
+        :type command: str, list
+        :param command: command to be sent to server
+        :rtype: dict
+        :returns: JSON response received from server
+
+        Send the request to the server.
+
+        If an identical query is already in progress, its response is awaited
+        rather than sending the query again."""
+        command = self._params(command)
+
+        if not self._is_query(command):
+            return await self._post(command)
+
+        # No await between the lookup and the insert, so no lock is needed
+        key = (self.ref, tuple(command))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._post(command))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so that cancelling one caller does not cancel the request
+        # for the others
+        return await asyncio.shield(task)
+
+    async def _post(self, command, player=None):
+        """
+        :type command: list
+        :param command: command to be sent to server
+        :type player: str
+        :param player: MAC address of the target player (default: this player)
+        :rtype: dict
+        :returns: JSON response received from server
+        """
+        if player is None:
+            player = self.ref
+
+        payload = self.server.build_payload(player, list(command))
+
+        LOG.debug('Request payload: %s', payload)
+        try:
+            async with self.session.post(self.server.url, json=payload,
+                                         timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    return (await response.json(content_type=None))['result']
+
+                LOG.error("%s - %s", response.status, await response.text())
+                return None
+        except asyncio.TimeoutError as err:
+            raise LMSConnectionError("Could not connect to server.") from err
+        except aiohttp.ClientConnectionError as err:
+            raise LMSServerError("Null response - likely problem with request") from err
+
+    async def parse_request(self, command, key):
+        """
+        :type command: str, list
+        :param command: command to be sent to server
+        :type key: str
+        :param key: key to retrieve desired info from JSON response
+        :returns: value from JSON response
+
+        Send the request and extract the info from the JSON response.
+        """
+        return (await self.request(command) or {}).get(key)
+
+    @property
+    def name(self) -> str:
+        """
+        :rtype: str, unicode
+        :returns: name of the player (as retrieved by :meth:`update`)
+        """
+        return self._name
+
+    @property
+    def model(self) -> str:
+        """
+        :rtype: str, unicode
+        :returns: model name of the player (as retrieved by :meth:`update`)
+        """
+        return self._model
+
+    @property
+    def ip(self) -> str:
+        """
+        :rtype: str, unicode
+        :returns: ip address of the player (as retrieved by :meth:`update`)
+        """
+        return self._ip
+
+    async def set_name(self, name):
+        """Set the player name."""
+        await self.request(["name", name])
+        self._name = name
+
+    async def play(self):
+        """Start playing the current item"""
+        await self.request(COMMANDS["play"])
+
+    async def stop(self):
+        """Stop the player"""
+        await self.request(COMMANDS["stop"])
+
+    async def pause(self):
+        """Pause the player. This does not unpause the player if already paused."""
+        await self.request(COMMANDS["pause"])
+
+    async def unpause(self):
+        """Unpause the player."""
+        await self.request(COMMANDS["unpause"])
+
+    async def toggle(self):
+        """Play/Pause Toggle"""
+        await self.request(COMMANDS["toggle"])
+
+    async def next(self):
+        """Play next item in playlist"""
+        await self.request(COMMANDS["next"])
+
+    async def prev(self):
+        """Play previous item in playlist"""
+        await self.request(COMMANDS["prev"])
+
+    async def seek_to(self, seconds: float):
+        """
+        :type seconds: int, float
+        :param seconds: position (in seconds) that player should seek to
+
+        Move player to specified position in current playlist item"""
+        params = self._seek_params(seconds)
+        if params is not None:
+            await self.request(params)
+
+    async def forward(self, seconds=10):
+        """
+        :type seconds: int, float
+        :param seconds: number of seconds to jump forwards in current track.
+
+        Jump forward in current track. Number of seconds will be converted to integer.
+        """
+        params = self._jump_params(seconds, "+")
+        if params is not None:
+            await self.request(params)
+
+    async def rewind(self, seconds=10):
+        """
+        :type seconds: int, float
+        :param seconds: number of seconds to jump backwards in current track.
+
+        Jump backwards in current track. Number of seconds will be converted to integer.
+        """
+        params = self._jump_params(seconds, "-")
+        if params is not None:
+            await self.request(params)
+
+    async def mode(self) -> str:
+        """
+        :rtype: str, unicode
+        :returns: current mode (e.g. "play", "pause")
+        """
+        return await self.parse_request(*QUERIES["mode"])
+
+    async def volume(self) -> int:
+        """
+        :rtype: int
+        :returns: current volume
+        """
+        return _int_or(await self.parse_request(*QUERIES["volume"]))
+
+    async def set_volume(self, volume):
+        """Set Player Volume (Min: 0, Max: 100)"""
+        params = self._volume_params(volume)
+        if params is not None:
+            await self.request(params)
+
+    async def volume_up(self, interval=5):
+        """
+        Increase volume
+
+        :type interval: int
+        :param interval: amount to increase volume (default 5)
+
+        """
+        await self.request(self._volume_step_params(interval, "+"))
+
+    async def volume_down(self, interval=5):
+        """
+        Decrease volume
+
+        :type interval: int
+        :param interval: amount to decrease volume (default 5)
+
+        """
+        await self.request(self._volume_step_params(interval, "-"))
+
+    async def muted(self) -> bool:
+        """
+        :rtype: bool
+        :returns: True if muted, False if not.
+        """
+        return await self.parse_request(*QUERIES["muting"]) == 1
+
+    async def set_muted(self, muting):
+        """Set muting status (True = muted)"""
+        await self.request(self._muting_params(muting))
+
+    async def mute(self):
+        """Mute player"""
+        await self.set_muted(True)
+
+    async def unmute(self):
+        """Unmute player"""
+        await self.set_muted(False)
+
+    async def wifi_signal_strength(self):
+        """
+        :rtype: int
+        :returns: Wifi signal strength
+        """
+        return await self.parse_request(*QUERIES["signalstrength"])
+
+    async def current_title(self) -> str:
+        """
+        :rtype: unicode, str
+        :returns: name of the current playing track/stream
+        """
+        return await self.parse_request(*QUERIES["current_title"])
+
+    async def track_artist(self) -> str:
+        """
+        :rtype: unicode, str
+        :returns: name of artist for current playlist item
+        """
+        return await self.parse_request(*QUERIES["artist"])
+
+    async def track_album(self) -> str:
+        """
+        :rtype: unicode, str
+        :returns: name of album for current playlist item
+        """
+        return await self.parse_request(*QUERIES["album"])
+
+    async def track_title(self) -> str:
+        """
+        :rtype: unicode, str
+        :returns: name of track for current playlist item
+        """
+        return await self.parse_request(*QUERIES["title"])
+
+    async def track_duration(self) -> float:
+        """
+        :rtype: float
+        :returns: duration of track in seconds
+        """
+        return _float_or(await self.parse_request(*QUERIES["duration"]))
+
+    async def time_elapsed(self) -> float:
+        """
+        :rtype: float
+        :returns: elapsed time in seconds. Returns 0.0 if an exception is encountered.
+        """
+        return _float_or(await self.parse_request(*QUERIES["time"]))
+
+    async def _bulk_status(self, tags) -> dict:
+        """
+        :type tags: list
+        :param tags: tags to request for the current playlist item
+        :rtype: dict
+        :returns: status response with the fields of the current playlist item
+                  merged into the top level
+
+        See :meth:`pylmstools.player.LMSPlayer._bulk_status`.
+        """
+        return self._merge_status(await self.request(self._status_params(tags)))
+
+    async def refresh_state(self) -> dict:
+        """
+        :rtype: dict
+        :returns: mode, volume, muted, time, duration, title, artist, album
+                  and current_title of the player from a single request
+
+        See :meth:`pylmstools.player.LMSPlayer.refresh_state`.
+        """
+        return self._parse_state(await self._bulk_status(STATE_TAGS))
+
+    async def track_elapsed_and_duration(self) -> tuple:
+        """
+        :rtype: tuple (float, float)
+        :returns: tuple of elapsed time and track duration from one ``status``
+                  request. Missing values are returned as 0.0.
+        """
+        return self._parse_elapsed_and_duration(await self._bulk_status([LMSTags.DURATION]))
+
+    async def percentage_elapsed(self, upper=100) -> float:
+        """
+        :type upper: float, int
+        :param upper: (optional) scale - returned value is between 0 and upper (default 100)
+        :rtype: float
+        :returns: current percentage elapsed
+        """
+        try:
+            elapsed, duration = await self.track_elapsed_and_duration()
+            return (elapsed / duration) * upper
+        except ZeroDivisionError:
+            return 0.0
+
+    async def time_remaining(self) -> float:
+        """
+        :rtype: float
+        :returns: remaining time in seconds. Returns 0.0 if an exception is encountered.
+        """
+        elapsed, duration = await self.track_elapsed_and_duration()
+        return duration - elapsed
+
+    async def track_count(self) -> int:
+        """
+        :rtype: int
+        :returns: number of tracks in playlist
+        """
+        return _int_or(await self.parse_request(*QUERIES["tracks"]))
+
+    async def playlist_position(self) -> int:
+        """
+        :rtype: int
+        :returns: position of current track in playlist
+        """
+        return _int_or(await self.parse_request(*QUERIES["index"]))
+
+    async def playlist_play_index(self, index):
+        """
+        :type index: int
+        :param index: index of playlist track to play (zero-based index)
+        """
+        return await self.request(self._playlist_params("index", index))
+
+    async def playlist_get_current_detail(self, amount=None, taglist=None) -> List:
+        """
+        :type amount: int
+        :param amount: number of tracks to query
+        :type taglist: list
+        :param taglist: list of tags (NEED LINK)
+        :rtype: list
+        :returns: server result
+
+        See :meth:`pylmstools.player.LMSPlayer.playlist_get_current_detail`.
+        """
+        if taglist is None:
+            taglist = DETAILED_TAGS
+        return await self.playlist_get_info(start=await self.playlist_position(),
+                                            amount=amount,
+                                            taglist=taglist)
+
+    async def playlist_get_detail(self, start=None, amount=None, taglist=None) -> List:
+        """
+        :type start: int
+        :param start: playlist index of first track to query
+        :type amount: int
+        :param amount: number of tracks to query
+        :type taglist: list
+        :param taglist: list of tags (NEED LINK)
+        :rtype: list
+        :returns: server result
+
+        See :meth:`pylmstools.player.LMSPlayer.playlist_get_detail`.
+        """
+        if taglist is None:
+            taglist = DETAILED_TAGS
+        return await self.playlist_get_info(start=start,
+                                            amount=amount,
+                                            taglist=taglist)
+
+    async def playlist_get_info(self, taglist=None, start=None, amount=None) -> List:
+        """
+        :type start: int
+        :param start: playlist index of first track to query
+        :type amount: int
+        :param amount: number of tracks to query
+        :type taglist: list
+        :param taglist: list of tags (NEED LINK)
+        :rtype: list
+        :returns: server result
+
+        See :meth:`pylmstools.player.LMSPlayer.playlist_get_info`.
+        """
+        command = self._playlist_info_params(taglist, start, amount)
+
+        try:
+            return await self.parse_request(command, "playlist_loop")
+        except (LMSServerError, LMSConnectionError, AttributeError):
+            return []
+
+    async def playlist_get_info_many(self, indices, taglist=None) -> List:
+        """
+        :type indices: list
+        :param indices: playlist indices of the tracks to query
+        :type taglist: list
+        :param taglist: list of tags (NEED LINK)
+        :rtype: list
+        :returns: server result for the requested tracks
+
+        See :meth:`pylmstools.player.LMSPlayer.playlist_get_info_many`.
+        """
+        playlist_range = self._playlist_range(indices)
+        if playlist_range is None:
+            return []
+
+        start, amount, wanted = playlist_range
+        tracks = await self.playlist_get_info(taglist=taglist, start=start, amount=amount) or []
+        return [track for track in tracks if track.get("playlist index") in wanted]
+
+    async def playlist_play(self, item):
+        """
+        Play item
+
+        :type item: str
+        :param item: link to playable item
+        """
+        await self.request(self._playlist_params("play", item))
+
+    async def playlist_add(self, item):
+        """
+        Add item to playlist
+
+        :type item: str
+        :param item: link to playable item
+        """
+        await self.request(self._playlist_params("add", item))
+
+    async def playlist_insert(self, item):
+        """
+        Insert item into playlist (after current track)
+
+        :type item: str
+        :param item: link to playable item
+        """
+        await self.request(self._playlist_params("insert", item))
+
+    async def playlist_delete(self, item):
+        """
+        Delete item
+
+        :type item: str
+        :param item: link to playable item
+        """
+        await self.request(self._playlist_params("deleteitem", item))
+
+    async def playlist_clear(self):
+        """Clear the entire playlist. Will also stop the player."""
+        await self.request(COMMANDS["playlist_clear"])
+
+    async def playlist_move(self, from_index, to_index):
+        """
+        Move items in playlist
+
+        :type from_index: int
+        :param from_index: index of item to move
+        :type to_index: int
+        :param to_index: new playlist position
+        """
+        await self.request(self._playlist_params("move", from_index, to_index))
+
+    async def playlist_erase(self, index):
+        """
+        Remove item from playlist by index
+
+        :type index: int
+        :param index: index of item to delete
+        """
+        await self.request(self._playlist_params("delete", index))
+
+    async def sync(self, player=None, ref=None, index=None, master=True):
+        """
+        Synchronise squeezeplayers
+
+        :type player: AsyncLMSPlayer
+        :param player: Instance of player
+        :type ref: str
+        :param ref: MAC address of player
+        :type index: int
+        :param index: server index of squeezeplayer
+        :type master: bool
+        :param master: whether current player should be the master player in \
+        sync group
+        :raises: LMSPlayerError
+
+        See :meth:`pylmstools.player.LMSPlayer.sync`.
+        """
+        target = self._sync_target(player, ref, index, master)
+
+        if master:
+            await self.request(["sync", target])
+        else:
+            await self._post(["sync", self.ref], player=target)
+
+    async def unsync(self):
+        """Remove player from syncgroup."""
+        await self.request(COMMANDS["unsync"])
+
+    async def get_synced_players(self, refs_only=False) -> List:
+        """
+        Retrieve list of players synced to current player.
+
+        :type refs_only: bool
+        :param refs_only: whether the method should return list of MAC \
+        references or list of AsyncLMSPlayer instances.
+        :rtype: list
+
+        Players are created concurrently and share this player's session.
+        """
+        refs = self._synced_refs(await self.parse_request(*QUERIES["sync"]))
+
+        if refs_only or not refs:
+            return refs
+
+        cls = type(self)
+        return list(await asyncio.gather(
+            *[cls.create(ref, self.server, session=self.session) for ref in refs]))
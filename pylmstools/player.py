@@ -3,10 +3,16 @@ Tools for interacting with LMS player (client) devices
 """
 
 import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from copy import deepcopy
+from contextlib import contextmanager
+from time import monotonic
 from typing import List
 from pylmstools.tags import LMSTags
 
-LOG = logging.getLogger()
+LOG = logging.getLogger(__name__)
 
 DETAILED_TAGS = [LMSTags.ARTIST,
                  LMSTags.COVERID,
@@ -17,12 +23,249 @@ DETAILED_TAGS = [LMSTags.ARTIST,
                  LMSTags.REMOTE,
                  LMSTags.ARTWORK_TRACK_ID]
 
+DETAILED_TAGS_STR = "tags:" + ",".join(DETAILED_TAGS)
+
+# Tags requested for the current playlist item by refresh_state()
+STATE_TAGS = [LMSTags.ARTIST, LMSTags.ALBUM, LMSTags.DURATION]
+
+# Maximum number of responses held in a player's response cache
+CACHE_MAXSIZE = 256
+
+# Number of players requested in a serverstatus query
+MAX_PLAYERS = 999
+
+# Number of playlist items requested when all items are wanted. The server
+# returns only the items that exist, so no track count is needed up front.
+MAX_PLAYLIST_ITEMS = 999999
+
+# Seconds for which the player list retrieved by all_players() is reused
+PLAYER_LIST_TTL = 10
+
+# Maximum number of seconds for which metadata of the current track is cached
+TRACK_CACHE_MAXAGE = 5
+
+# Commands used to query track metadata that is missing from a status response
+TRACK_QUERIES = {"current_title": (("current_title", "?"), "_current_title"),
+                 "title": (("title", "?"), "_title"),
+                 "artist": (("artist", "?"), "_artist"),
+                 "album": (("album", "?"), "_album"),
+                 "duration": (("duration", "?"), "_duration")}
+
+# Player queries: (command, key of the value in the response)
+QUERIES = dict(TRACK_QUERIES,
+               name=(("name", "?"), "_value"),
+               model=(("player", "model", "?"), "_model"),
+               ip=(("player", "ip", "?"), "_ip"),
+               mode=(("mode", "?"), "_mode"),
+               muting=(("mixer", "muting", "?"), "_muting"),
+               volume=(("mixer", "volume", "?"), "_volume"),
+               signalstrength=(("signalstrength", "?"), "_signalstrength"),
+               time=(("time", "?"), "_time"),
+               tracks=(("playlist", "tracks", "?"), "_tracks"),
+               index=(("playlist", "index", "?"), "_index"),
+               sync=(("sync", "?"), "_sync"))
+
+# Player commands without arguments
+COMMANDS = {"play": ("play",),
+            "stop": ("stop",),
+            "pause": ("pause", "1"),
+            "unpause": ("pause", "0"),
+            "toggle": ("pause",),
+            "next": ("playlist", "jump", "+1"),
+            "prev": ("playlist", "jump", "-1"),
+            "playlist_clear": ("playlist", "clear"),
+            "unsync": ("sync", "-")}
+
+def _float_or(value, default=0.0) -> float:
+    """Convert a server response value to float, or return default if it is missing."""
+    return float(value) if value is not None else default
+
+def _int_or(value, default=0) -> int:
+    """Convert a server response value to int, or return default if it is missing."""
+    return int(value) if value is not None else default
+
 class LMSPlayerError(Exception):
     """
     Exception when a player request/action fails
     """
 
-class LMSPlayer():
+class LMSPlayerBase():
+    """
+    Transport independent logic shared by :class:`LMSPlayer` and
+    :class:`pylmstools.aplayer.AsyncLMSPlayer`.
+
+    This class builds the parameters of player commands and parses the
+    responses of the server, but sends no requests itself.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"{type(self).__name__}: {self.name} ({self.ref})"
+
+    def __eq__(self, other):
+        # Useful to have a method to test for equality.
+        # Test will match player instances and also MAC address string.
+        if isinstance(other, LMSPlayerBase):
+            return self.ref.lower() == other.ref.lower()
+        if isinstance(other, str):
+            return self.ref.lower() == other.lower()
+        return NotImplemented
+
+    def __hash__(self):
+        # Hashed on the lowercase reference so that players differing only in
+        # case collide. A str hashes on its own value, so MAC address strings
+        # only find a player in a set or dict when written in lowercase (as
+        # reported by LMS), although == compares them case insensitively.
+        return hash(self.ref.lower())
+
+    @staticmethod
+    def _params(command):
+        """Split a string command on spaces. Lists and tuples are returned as they are."""
+        if isinstance(command, (list, tuple)):
+            return command
+        return command.split(' ')
+
+    @staticmethod
+    def _is_query(params) -> bool:
+        """Queries end in "?" or are status requests. Any other command is mutating."""
+        return params[-1] == "?" or params[0] == "status"
+
+    @staticmethod
+    def _status_params(tags) -> tuple:
+        """Parameters of a status request for the current playlist item."""
+        if tags:
+            return ("status", "-", "1", f"tags:{','.join(tags)}")
+        return ("status", "-", "1")
+
+    @staticmethod
+    def _merge_status(response) -> dict:
+        """
+        Merge the fields of the first playlist item of a status response into
+        the top level of the response. Top level values take precedence.
+        """
+        response = response or {}
+        status = {}
+        for item in response.get("playlist_loop", [])[:1]:
+            status.update(item)
+        status.update(response)
+        return status
+
+    @staticmethod
+    def _parse_state(status) -> dict:
+        """Build the player state (see refresh_state) from a merged status response."""
+        # LMS reports the volume of a muted player as a negative value
+        volume = _int_or(status.get("mixer volume"))
+
+        return {"mode": status.get("mode"),
+                "volume": volume,
+                "muted": volume < 0,
+                "time": _float_or(status.get("time")),
+                "duration": _float_or(status.get("duration")),
+                "title": status.get("title"),
+                "artist": status.get("artist"),
+                "album": status.get("album"),
+                "current_title": status.get("current_title")}
+
+    @staticmethod
+    def _parse_elapsed_and_duration(status) -> tuple:
+        """(elapsed, duration) from a merged status response. Missing values are 0.0."""
+        return _float_or(status.get("time")), _float_or(status.get("duration"))
+
+    @staticmethod
+    def _seek_params(seconds):
+        """Parameters to seek to an absolute position, or None if seconds is None."""
+        try:
+            return ("time", str(float(seconds)))
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _jump_params(seconds, sign):
+        """Parameters to jump by a whole number of seconds, or None if seconds is None."""
+        try:
+            return ("time", f"{sign}{int(seconds)}")
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _volume_params(volume):
+        """Parameters to set the volume (clamped to 0-100), or None if volume is None."""
+        try:
+            return ("mixer", "volume", str(min(100, max(0, int(volume)))))
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _volume_step_params(interval, sign) -> tuple:
+        return ("mixer", "volume", f"{sign}{interval}")
+
+    @staticmethod
+    def _muting_params(muting) -> tuple:
+        return ("mixer", "muting", "1" if muting else "0")
+
+    @staticmethod
+    def _playlist_params(*args) -> tuple:
+        """Parameters of a playlist command, e.g. ("playlist", "add", item)."""
+        return ("playlist",) + tuple(str(arg) for arg in args)
+
+    @staticmethod
+    def _playlist_info_params(taglist=None, start=None, amount=None) -> tuple:
+        """Parameters of a status request for a range of playlist items."""
+        if amount is None:
+            amount = MAX_PLAYLIST_ITEMS
+
+        if start is None:
+            start = 0
+
+        if taglist is DETAILED_TAGS:
+            return ("status", str(start), str(amount), DETAILED_TAGS_STR)
+        if taglist:
+            return ("status", str(start), str(amount), f"tags:{','.join(taglist)}")
+        return ("status", str(start), str(amount))
+
+    @staticmethod
+    def _playlist_range(indices):
+        """
+        Smallest (start, amount, wanted) range covering the given playlist
+        indices, or None if there are no valid indices.
+        """
+        wanted = {index for index in indices if index >= 0}
+        if not wanted:
+            return None
+        start = min(wanted)
+        return start, max(wanted) - start + 1, wanted
+
+    @staticmethod
+    def _sync_target(player=None, ref=None, index=None, master=True):
+        """
+        Validate the arguments of sync and return the reference (or index) of
+        the other player.
+        """
+        if not any([player, ref, index is not None]):
+            raise LMSPlayerError("You must provide a LMSPlayer object, "
+                                 "player reference or player index.")
+
+        if not master and not any([player, ref]):
+            raise LMSPlayerError("You must provide a player object or reference"
+                                 " if you wish player to be added to existing "
+                                 "group.")
+
+        if player:
+            return player.ref
+        if ref:
+            return ref
+        return index
+
+    @staticmethod
+    def _synced_refs(sync):
+        """List of synced player references from a "sync ?" response value."""
+        if sync is None or str(sync) == "-":
+            return []
+        return sync.split(",")
+
+
+class LMSPlayer(LMSPlayerBase):
     """
     The LMSPlayer class represents an individual squeeze player connected to
     your Logitech Media Server.
@@ -52,15 +295,39 @@ class LMSPlayer():
         >>>player.model
         u'squeezelite'
 
+    Responses to queries (commands ending in "?" and ``status`` requests) are
+    cached for ``cache_ttl`` seconds so that reading several properties in quick
+    succession does not repeat identical requests. Any other command clears the
+    cache. Set ``cache_ttl`` to 0 to disable caching.
+
     """
 
-    def __init__(self, ref, server):
+    __slots__ = ("server", "ref", "cache_ttl", "_cache", "_cache_generation", "_inflight",
+                 "_inflight_lock", "_name", "_model", "_ip", "_track_cache",
+                 "_track_cache_expires", "_track_key", "_snapshot", "__weakref__")
+
+    # Most recent all_players() result of each server: (expiry, [player info])
+    _player_lists = weakref.WeakKeyDictionary()
+
+    def __init__(self, ref, server, cache_ttl=0.5):
+        self._init_attributes(ref, server, cache_ttl)
+        self.update()
+
+    def _init_attributes(self, ref, server, cache_ttl):
         self.server = server
         self.ref = ref
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._cache_generation = 0
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
         self._name = None
         self._model = None
         self._ip = None
-        self.update()
+        self._track_cache = {}
+        self._track_cache_expires = 0.0
+        self._track_key = None
+        self._snapshot = None
 
     @classmethod
     def from_index(cls, index, server):
@@ -70,35 +337,153 @@ class LMSPlayer():
         This class method uses the index of the player (as registered on the server)
         to identify the player.
 
+        If :meth:`all_players` was called for this server within the last
+        PLAYER_LIST_TTL seconds, the player is created from that result without
+        any further requests.
+
         :rtype: LMSPlayer
         :returns: Instance of squeezeplayer
         """
+        expiry, players_loop = cls._player_lists.get(server, (0.0, []))
+        if (monotonic() < expiry and isinstance(index, int)
+                and 0 <= index < len(players_loop)):
+            return cls._from_player_info(players_loop[index], server)
+
         ref = server.request(params=["player",  "id",  index, "?"])["_id"]
         return cls(ref, server)
 
-    def __repr__(self):
-        return f"LMSPlayer: {self.name} ({self.ref})"
+    @classmethod
+    def all_players(cls, server, cache_ttl=0.5) -> List:
+        """
+        Create instances of LMSPlayer for all players connected to the server.
 
-    def __eq__(self, other):
-        # Useful to have a method to test for equality.
-        # Test will match player instances and also MAC address string.
+        Name, model and ip of every player are retrieved with a single
+        ``serverstatus`` request.
 
-        try:
-            return self.ref == other.ref
-        except AttributeError:
-            if isinstance(other) == str:
-                return self.ref.lower() == other.lower()
-            return False
+        :rtype: list
+        :returns: list of LMSPlayer instances, ordered by player index
+        """
+        return [cls._from_player_info(item, server, cache_ttl)
+                for item in cls._load_player_list(server)]
+
+    @classmethod
+    def _load_player_list(cls, server) -> List:
+        """
+        Retrieve the ``serverstatus`` players_loop of the server and remember it
+        for PLAYER_LIST_TTL seconds.
+        """
+        status = server.request(params=["serverstatus", "0", str(MAX_PLAYERS)]) or {}
+        players_loop = status.get("players_loop", [])
+        cls._player_lists[server] = (monotonic() + PLAYER_LIST_TTL, players_loop)
+        return players_loop
+
+    @classmethod
+    def _cached_player_list(cls, server) -> List:
+        """
+        Return the players_loop remembered for the server, retrieving it again
+        if it is older than PLAYER_LIST_TTL seconds.
+        """
+        expiry, players_loop = cls._player_lists.get(server, (0.0, []))
+        if monotonic() < expiry:
+            return players_loop
+        return cls._load_player_list(server)
+
+    @classmethod
+    def _from_player_info(cls, item, server, cache_ttl=0.5):
+        """
+        Create an instance of LMSPlayer from an entry of a ``serverstatus``
+        players_loop.
+        """
+        return cls._from_preloaded(item.get("playerid"), server,
+                                   item.get("name"),
+                                   item.get("model"),
+                                   item.get("ip"),
+                                   cache_ttl=cache_ttl)
+
+    @classmethod
+    def _from_preloaded(cls, ref, server, name, model, ip, cache_ttl=0.5):
+        """
+        Create an instance of LMSPlayer from info that has already been
+        retrieved from the server (e.g. by a ``serverstatus`` request).
+
+        Unlike the constructor, this sends no requests to the server.
+
+        :rtype: LMSPlayer
+        :returns: Instance of squeezeplayer
+        """
+        player = cls.__new__(cls)
+        player._init_attributes(ref, server, cache_ttl)
+        player._name = name
+        player._model = model
+        player._ip = ip
+        return player
 
     def update(self):
         """
         Retrieve some basic info about the player.
 
         Retrieves the name, model and ip attributes. This method is called on initialisation.
+
+        Name and ip are read from a single ``status`` request. The model is not
+        reported by ``status`` so is queried separately.
+        """
+        status = self._bulk_status([])
+        self._name = status.get("player_name")
+        if self._name is None:
+            self._name = self.parse_request(*QUERIES["name"])
+        self._ip = status.get("player_ip")
+        self._model = self.parse_request(*QUERIES["model"])
+
+    def _bulk_status(self, tags) -> dict:
+        """
+        :type tags: list
+        :param tags: list of tags to request for the current playlist item
+        :rtype: dict
+        :returns: status response with the current playlist item merged in
+
+        Send a single ``status`` request for the current playlist item and merge
+        the fields of that item into the top level of the response. Top level
+        values take precedence over those of the playlist item.
+
+        If the response shows that the current track has changed (e.g. by
+        another controller), the cached track metadata is discarded.
+        """
+        status = self._merge_status(self.request(self._status_params(tags)))
+
+        track_key = (status.get("playlist_cur_index"), status.get("id"))
+        if track_key != self._track_key:
+            self._invalidate_track_cache()
+            self._track_key = track_key
+
+        return status
+
+    def refresh_state(self) -> dict:
+        """
+        Retrieve the current playback state of the player in one request.
+
+        :rtype: dict
+        :returns: dictionary with keys ``mode``, ``volume``, ``muted``, ``time``,
+                  ``duration``, ``title``, ``artist``, ``album`` and
+                  ``current_title``. As for the ``volume`` property, the volume
+                  of a muted player is negative.
+
+        Use :meth:`prefetch` to have the property getters read from this state.
+
+        ::
+
+            >>>player.refresh_state()
+            {'mode': u'play',
+             'volume': 50,
+             'muted': False,
+             'time': 4.86446976280212,
+             'duration': 384.809,
+             'title': u'Lit',
+             'artist': u'Kiasmos',
+             'album': u'Kiasmos',
+             'current_title': None}
+
         """
-        self._name = self.name
-        self._model = self.parse_request("player model ?", "_model")
-        self._ip = self.parse_request("player ip ?", "_ip")
+        return self._parse_state(self._bulk_status(STATE_TAGS))
 
     def request(self, command):
         """
@@ -107,8 +492,173 @@ class LMSPlayer():
         :rtype: dict
         :returns: JSON response received from server
 
-        Send the request to the server."""
-        return self.server.request(player=self.ref, params=command.split(' '))
+        Send the request to the server. A string command is split on spaces,
+        a list or tuple is sent as it is.
+
+        Responses to queries are served from the cache while they are younger
+        than ``cache_ttl``. Any other command invalidates the cache. Cached
+        responses are returned as copies, so callers may modify them.
+
+        If an identical query is already in progress in another thread, its
+        response is awaited rather than sending the query again."""
+        params = self._params(command)
+
+        if not self._is_query(params):
+            self.clear_cache()
+            return self.server.request(player=self.ref, params=params)
+
+        key = (self.ref, tuple(params))
+        now = monotonic()
+        if self.cache_ttl:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > now:
+                return deepcopy(cached[1])
+
+        # Queries started before the cache was last cleared are not shared with
+        # later callers and their responses are not cached
+        with self._inflight_lock:
+            generation = self._cache_generation
+            inflight_key = (key, generation)
+            future = self._inflight.get(inflight_key)
+            pending = future is not None
+            if not pending:
+                future = Future()
+                self._inflight[inflight_key] = future
+
+        if pending:
+            return deepcopy(future.result())
+
+        try:
+            response = self.server.request(player=self.ref, params=params)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            shared = deepcopy(response)
+            with self._inflight_lock:
+                if (self.cache_ttl and response is not None
+                        and generation == self._cache_generation):
+                    if len(self._cache) >= CACHE_MAXSIZE:
+                        self._cache.clear()
+                    self._cache[key] = (now + self.cache_ttl, shared)
+            future.set_result(shared)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+
+        return response
+
+    def clear_cache(self):
+        """Discard all cached responses and any prefetched state for this player."""
+        with self._inflight_lock:
+            self._cache_generation += 1
+            self._cache.clear()
+        self._snapshot = None
+
+    def prefetch(self, ttl=1.0) -> dict:
+        """
+        :type ttl: float
+        :param ttl: number of seconds for which the retrieved state is used
+        :rtype: dict
+        :returns: player state (see :meth:`refresh_state`)
+
+        Retrieve the playback state of the player in one request. For the next
+        ``ttl`` seconds, ``mode``, ``volume``, ``muted``, ``time_elapsed`` and the
+        track properties are read from this state instead of the server. Any
+        command sent to the player discards the prefetched state.
+
+        ::
+
+            >>>player.prefetch()
+            >>>player.track_title, player.track_artist, player.volume
+            (u'Lit', u'Kiasmos', 50)
+
+        """
+        state = self.refresh_state()
+        self._snapshot = (monotonic() + ttl, dict(state))
+        return state
+
+    @contextmanager
+    def prefetched(self, ttl=1.0):
+        """
+        :type ttl: float
+        :param ttl: maximum number of seconds for which the retrieved state is used
+
+        Context manager that prefetches the player state on entry and discards
+        it on exit.
+
+        ::
+
+            >>>with player.prefetched():
+            ...    print(player.mode, player.track_title, player.percentage_elapsed())
+
+        """
+        self.prefetch(ttl)
+        try:
+            yield self
+        finally:
+            self._snapshot = None
+
+    def _snapshot_value(self, key):
+        """
+        :type key: str
+        :param key: key of the state returned by :meth:`refresh_state`
+        :returns: prefetched value, or None if there is no fresh prefetched value
+        """
+        if self._snapshot is None:
+            return None
+
+        expiry, state = self._snapshot
+        if monotonic() >= expiry:
+            self._snapshot = None
+            return None
+
+        return state.get(key)
+
+    def close(self):
+        """
+        Discard the cached state of this player.
+
+        The player does not hold a connection of its own: all requests go
+        through the HTTP session of its server, which is shared with the other
+        players. Use ``server.close()`` to release the connection.
+        """
+        self.clear_cache()
+        self._invalidate_track_cache()
+
+    def _track_info(self, key):
+        """
+        :type key: str
+        :param key: one of the keys of TRACK_QUERIES
+        :returns: metadata value for the current playlist item
+
+        Track metadata is retrieved with a single ``status`` request and kept
+        for at most TRACK_CACHE_MAXAGE seconds. It is discarded earlier when the
+        current track could have finished playing, when a method that changes
+        the current track is called, or when any ``status`` response shows a
+        different current track.
+        """
+        value = self._snapshot_value(key)
+        if value is not None:
+            return value
+
+        if monotonic() >= self._track_cache_expires:
+            state = self.refresh_state()
+            self._track_cache = {k: state[k] for k in TRACK_QUERIES
+                                 if state[k] is not None}
+            remaining = max(state["duration"] - state["time"], 0.0)
+            self._track_cache_expires = monotonic() + min(remaining, TRACK_CACHE_MAXAGE)
+
+        if key not in self._track_cache:
+            command, response_key = TRACK_QUERIES[key]
+            self._track_cache[key] = self.parse_request(command, response_key)
+
+        return self._track_cache[key]
+
+    def _invalidate_track_cache(self):
+        """Discard cached metadata for the current playlist item."""
+        self._track_cache = {}
+        self._track_cache_expires = 0.0
 
     def parse_request(self, command, key):
         """
@@ -126,31 +676,33 @@ class LMSPlayer():
 
     def play(self):
         """Start playing the current item"""
-        self.request("play")
+        self.request(COMMANDS["play"])
 
     def stop(self):
         """Stop the player"""
-        self.request("stop")
+        self.request(COMMANDS["stop"])
 
     def pause(self):
         """Pause the player. This does not unpause the player if already paused."""
-        self.request("pause 1")
+        self.request(COMMANDS["pause"])
 
     def unpause(self):
         """Unpause the player."""
-        self.request("pause 0")
+        self.request(COMMANDS["unpause"])
 
     def toggle(self):
         """Play/Pause Toggle"""
-        self.request("pause")
+        self.request(COMMANDS["toggle"])
 
     def next(self):
         """Play next item in playlist"""
-        self.request("playlist jump +1")
+        self.request(COMMANDS["next"])
+        self._invalidate_track_cache()
 
     def prev(self):
         """Play previous item in playlist"""
-        self.request("playlist jump -1")
+        self.request(COMMANDS["prev"])
+        self._invalidate_track_cache()
 
     def mute(self):
         """Mute player"""
@@ -166,11 +718,10 @@ class LMSPlayer():
         :param seconds: position (in seconds) that player should seek to
 
         Move player to specified position in current playlist item"""
-        try:
-            seconds = float(seconds)
-            self.request(f"time {seconds}")
-        except TypeError:
-            pass
+        params = self._seek_params(seconds)
+        if params is not None:
+            self.request(params)
+            self._invalidate_track_cache()
 
     def forward(self, seconds=10):
         """
@@ -179,11 +730,10 @@ class LMSPlayer():
 
         Jump forward in current track. Number of seconds will be converted to integer.
         """
-        try:
-            seconds = int(seconds)
-            self.request(f"time +{seconds}")
-        except TypeError:
-            pass
+        params = self._jump_params(seconds, "+")
+        if params is not None:
+            self.request(params)
+            self._invalidate_track_cache()
 
     def rewind(self, seconds=10):
         """
@@ -192,11 +742,10 @@ class LMSPlayer():
 
         Jump backwards in current track. Number of seconds will be converted to integer.
         """
-        try:
-            seconds = int(seconds)
-            self.request(f"time -{seconds}")
-        except TypeError:
-            pass
+        params = self._jump_params(seconds, "-")
+        if params is not None:
+            self.request(params)
+            self._invalidate_track_cache()
 
     @property
     def name(self) -> str:
@@ -219,7 +768,7 @@ class LMSPlayer():
 
         """
         if self._name is None:
-            self._name = self.parse_request("name ?", "_value")
+            self._name = self.parse_request(*QUERIES["name"])
 
         return self._name
 
@@ -228,7 +777,7 @@ class LMSPlayer():
         """
         Set the player name.
         """
-        self.request(f"name {name}")
+        self.request(("name", name))
         self._name = name
 
 
@@ -246,7 +795,11 @@ class LMSPlayer():
         :rtype: str, unicode
         :returns: current mode (e.g. "play", "pause")
         """
-        return self.parse_request("mode ?", "_mode")
+        mode = self._snapshot_value("mode")
+        if mode is not None:
+            return mode
+
+        return self.parse_request(*QUERIES["mode"])
 
     @property
     def muted(self) -> bool:
@@ -257,7 +810,11 @@ class LMSPlayer():
         :rtype: bool
         :returns: True if muted, False if not.
         """
-        muted = self.parse_request("mixer muting ?", "_muting")
+        muted = self._snapshot_value("muted")
+        if muted is not None:
+            return muted
+
+        muted = self.parse_request(*QUERIES["muting"])
         if muted is None:
             return False
 
@@ -270,7 +827,7 @@ class LMSPlayer():
 
         :setter: set muting status (True = muted)
         """
-        self.request(f"mixer muting {int(muting)}")
+        self.request(self._muting_params(muting))
 
     @property
     def wifi_signal_strength(self):
@@ -278,7 +835,7 @@ class LMSPlayer():
         :rtype: int
         :returns: Wifi signal strength
         """
-        return self.parse_request("signalstrength ?", "_signalstrength")
+        return self.parse_request(*QUERIES["signalstrength"])
 
     @property
     def current_title(self) -> str:
@@ -286,7 +843,7 @@ class LMSPlayer():
         :rtype: unicode, str
         :returns: name of the current playing track/stream
         """
-        return self.parse_request("current_title ?", "_current_title")
+        return self._track_info("current_title")
 
     @property
     def track_artist(self) -> str:
@@ -300,7 +857,7 @@ class LMSPlayer():
             u'Kiasmos'
 
         """
-        return self.parse_request("artist ?", "_artist")
+        return self._track_info("artist")
 
     @property
     def track_album(self) -> str:
@@ -314,7 +871,7 @@ class LMSPlayer():
             u'Kiasmos'
 
         """
-        return self.parse_request("album ?", "_album")
+        return self._track_info("album")
 
     @property
     def track_title(self) -> str:
@@ -328,7 +885,7 @@ class LMSPlayer():
             u'Lit'
 
         """
-        return self.parse_request("title ?", "_title")
+        return self._track_info("title")
 
     @property
     def track_duration(self) -> float:
@@ -342,11 +899,7 @@ class LMSPlayer():
             384.809
 
         """
-        try:
-            duration = float(self.parse_request("duration ?", "_duration"))
-        except TypeError:
-            duration = 0.0
-        return duration
+        return _float_or(self._track_info("duration"))
 
     @property
     def track_elapsed_and_duration(self) -> tuple:
@@ -359,11 +912,22 @@ class LMSPlayer():
             >>>player.track_elapsed_and_duration
             (4.86446976280212, 384.809)
 
+        Both values are retrieved with a single request.
         """
-        duration = self.track_duration
-        elapsed = self.time_elapsed
+        elapsed = self._snapshot_value("time")
+        duration = self._snapshot_value("duration")
+        if elapsed is not None and duration is not None:
+            return elapsed, duration
 
-        return elapsed, duration
+        return self._elapsed_and_duration_single_call()
+
+    def _elapsed_and_duration_single_call(self) -> tuple:
+        """
+        :rtype: tuple (float, float)
+        :returns: tuple of elapsed time and track duration from one ``status``
+                  request. Missing values are returned as 0.0.
+        """
+        return self._parse_elapsed_and_duration(self._bulk_status([LMSTags.DURATION]))
 
     def percentage_elapsed(self, upper=100) -> float:
         """
@@ -393,12 +957,11 @@ class LMSPlayer():
         :returns: elapsed time in seconds. Returns 0.0 if an exception is encountered.
 
         """
-        try:
-            elapsed = float(self.parse_request("time ?", "_time"))
-        except TypeError:
-            elapsed = 0.0
+        elapsed = self._snapshot_value("time")
+        if elapsed is not None:
+            return elapsed
 
-        return elapsed
+        return _float_or(self.parse_request(*QUERIES["time"]))
 
     @property
     def time_remaining(self) -> float:
@@ -407,7 +970,8 @@ class LMSPlayer():
         :returns: remaining time in seconds. Returns 0.0 if an exception is encountered.
 
         """
-        return self.track_duration - self.time_elapsed
+        elapsed, duration = self.track_elapsed_and_duration
+        return duration - elapsed
 
     @property
     def track_count(self) -> int:
@@ -416,10 +980,7 @@ class LMSPlayer():
         :returns: number of tracks in playlist
 
         """
-        try:
-            return int(self.parse_request("playlist tracks ?", "_tracks"))
-        except TypeError:
-            return 0
+        return _int_or(self.parse_request(*QUERIES["tracks"]))
 
     def playlist_play_index(self, index) -> int:
         """
@@ -427,7 +988,9 @@ class LMSPlayer():
         :param index: index of playlist track to play (zero-based index)
 
         """
-        return self.request(f"playlist index {index}")
+        response = self.request(self._playlist_params("index", index))
+        self._invalidate_track_cache()
+        return response
 
     @property
     def playlist_position(self) -> int:
@@ -436,10 +999,7 @@ class LMSPlayer():
         :returns: position of current track in playlist
 
         """
-        try:
-            return int(self.parse_request("playlist index ?", "_index"))
-        except TypeError:
-            return 0
+        return _int_or(self.parse_request(*QUERIES["index"]))
 
     def playlist_get_current_detail(self, amount=None, taglist=None) -> List:
         """
@@ -540,24 +1100,47 @@ class LMSPlayer():
 
         """
         # Get info about the tracks in the current playlist
-        if amount is None:
-            amount = self.track_count
-
-        if start is None:
-            start = 0
-
-        tags = ""
-        if taglist:
-            tags_str = ','.join(taglist)
-            tags = f"tags:{tags_str}"
-
-        command = f"status {start} {amount} {tags}"
+        command = self._playlist_info_params(taglist, start, amount)
 
         try:
             return self.parse_request(command, "playlist_loop")
         except:
             return []
 
+    def playlist_get_info_many(self, indices, taglist=None) -> List:
+        """
+        :type indices: list
+        :param indices: playlist indices of the tracks to query
+        :type taglist: list
+        :param taglist: list of tags (NEED LINK)
+        :rtype: list
+        :returns: server result for the requested tracks, in playlist order
+
+        Retrieve several (not necessarily adjacent) playlist items with a single
+        request covering the range from the lowest to the highest index.
+
+        As with playlist_get_info, no default taglist is provided.
+
+        ::
+
+            >>>pos = player.playlist_position
+            >>>player.playlist_get_info_many([pos - 1, pos + 1])
+            [{u'id': u'-137990288',
+              u'playlist index': 6,
+              u'title': u'Mardy Bum'},
+             {u'id': u'-161090729',
+              u'playlist index': 8,
+              u'title': u'Trouble Town'}]
+
+        """
+        playlist_range = self._playlist_range(indices)
+        if playlist_range is None:
+            return []
+
+        start, amount, wanted = playlist_range
+        tracks = self.playlist_get_info(taglist=taglist, start=start, amount=amount) or []
+        return [track for track in tracks if track.get("playlist index") in wanted]
+
     def playlist_play(self, item):
         """
         Play item
@@ -566,7 +1149,8 @@ class LMSPlayer():
         :param item: link to playable item
 
         """
-        self.request(f"playlist play {item}")
+        self.request(self._playlist_params("play", item))
+        self._invalidate_track_cache()
 
     def playlist_add(self, item):
         """
@@ -576,7 +1160,7 @@ class LMSPlayer():
         :param item: link to playable item
 
         """
-        self.request(f"playlist add {item}")
+        self.request(self._playlist_params("add", item))
 
     def playlist_insert(self, item):
         """
@@ -586,7 +1170,8 @@ class LMSPlayer():
         :param item: link to playable item
 
         """
-        self.request(f"playlist insert {item}")
+        self.request(self._playlist_params("insert", item))
+        self._invalidate_track_cache()
 
     def playlist_delete(self, item):
         """
@@ -596,11 +1181,13 @@ class LMSPlayer():
         :param item: link to playable item
 
         """
-        self.request(f"playlist deleteitem {item}")
+        self.request(self._playlist_params("deleteitem", item))
+        self._invalidate_track_cache()
 
     def playlist_clear(self):
         """Clear the entire playlist. Will also stop the player."""
-        self.request("playlist clear")
+        self.request(COMMANDS["playlist_clear"])
+        self._invalidate_track_cache()
 
     def playlist_move(self, from_index, to_index):
         """
@@ -612,7 +1199,7 @@ class LMSPlayer():
         :param to_index: new playlist position
 
         """
-        self.request(f"playlist move {from_index} {to_index}")
+        self.request(self._playlist_params("move", from_index, to_index))
 
     def playlist_erase(self, index):
         """
@@ -622,7 +1209,8 @@ class LMSPlayer():
         :param index: index of item to delete
 
         """
-        self.request(f"playlist delete {index}")
+        self.request(self._playlist_params("delete", index))
+        self._invalidate_track_cache()
 
     @property
     def volume(self) -> int:
@@ -641,22 +1229,23 @@ class LMSPlayer():
             >>>player.volume = 50
 
         Min: 0, Max: 100
+
+        While the player is muted, LMS reports the volume that will be restored
+        on unmuting as a negative value, and this getter returns it unchanged
+        (e.g. -95). This is the same whether or not the state was prefetched.
         """
-        try:
-            return int(self.parse_request("mixer volume ?", "_volume"))
-        except TypeError:
-            return 0
+        volume = self._snapshot_value("volume")
+        if volume is not None:
+            return volume
+
+        return _int_or(self.parse_request(*QUERIES["volume"]))
 
     @volume.setter
     def volume(self, volume):
         """Set Player Volume"""
-        try:
-            volume = int(volume)
-            volume = max(0, volume)
-            volume = min(100, volume)
-            self.request(f"mixer volume {volume}")
-        except TypeError:
-            pass
+        params = self._volume_params(volume)
+        if params is not None:
+            self.request(params)
 
     def volume_up(self, interval=5):
         """
@@ -666,7 +1255,7 @@ class LMSPlayer():
         :param interval: amount to increase volume (default 5)
 
         """
-        self.request(f"mixer volume +{interval}")
+        self.request(self._volume_step_params(interval, "+"))
 
     def volume_down(self, interval=5):
         """
@@ -676,7 +1265,7 @@ class LMSPlayer():
         :param interval: amount to decrease volume (default 5)
 
         """
-        self.request(f"mixer volume -{interval}")
+        self.request(self._volume_step_params(interval, "-"))
 
     def sync(self, player=None, ref=None, index=None, master=True):
         """
@@ -698,31 +1287,21 @@ class LMSPlayer():
         player or ref.
 
         """
-        if not any([player, ref, index is not None]):
-            raise LMSPlayerError("You must provide a LMSPlayer object, "
-                                 "player reference or player index.")
-
-        if not master and not any([player, ref]):
-            raise LMSPlayerError("You must provide a player object or reference"
-                                 " if you wish player to be added to existing "
-                                 "group.")
-
-        if player:
-            target = player.ref
-        elif ref:
-            target = ref
-        else:
-            target = index
+        target = self._sync_target(player, ref, index, master)
 
         if master:
             self.request(["sync", target])
 
         else:
             self.server.request(player=target, params=["sync", self.ref])
+            self.clear_cache()
+
+        self._invalidate_track_cache()
 
     def unsync(self):
         """Remove player from syncgroup."""
-        self.request("sync -")
+        self.request(COMMANDS["unsync"])
+        self._invalidate_track_cache()
 
     def get_synced_players(self, refs_only=False) -> List:
         """
@@ -733,12 +1312,31 @@ class LMSPlayer():
         references or list of LMSPlayer instances.
         :rtype: list
         """
-        sync = self.parse_request("sync ?", "_sync")
+        refs = self._synced_refs(self.parse_request(*QUERIES["sync"]))
 
-        if str(sync) == "-":
-            return []
+        if refs_only or not refs:
+            return refs
 
-        if refs_only:
-            return sync.split(",")
+        # Imported here because pylmstools.server imports this module
+        from pylmstools.server import LMSConnectionError, LMSServerError
 
-        return [LMSPlayer(ref, self.server) for ref in sync.split(",")]
+        # Use the player list of the server (retrieved in one request and
+        # reused for PLAYER_LIST_TTL seconds) rather than initialising each
+        # synced player separately. Players missing from it, or all players
+        # if the list cannot be retrieved, are initialised individually.
+        cls = type(self)
+        try:
+            players_loop = cls._cached_player_list(self.server)
+        except (LMSServerError, LMSConnectionError):
+            players_loop = []
+        loaded = {item.get("playerid"): item for item in players_loop}
+
+        players = []
+        for ref in refs:
+            item = loaded.get(ref)
+            if item is None:
+                players.append(cls(ref, self.server, cache_ttl=self.cache_ttl))
+            else:
+                players.append(cls._from_player_info(item, self.server,
+                                                     cache_ttl=self.cache_ttl))
+        return players
@@ -8,7 +8,7 @@ import requests
 from pylmstools.player import LMSPlayer
 
 
-LOG = logging.getLogger()
+LOG = logging.getLogger(__name__)
 
 class LMSConnectionError(Exception):
     """
@@ -29,8 +29,9 @@ class LMSServer():
     :param port: port for the web interface (default 9000)
 
     Class for Logitech Media Server.
-    Provides access via JSON interface. As the class uses the JSON interface,
-    no active connections are maintained.
+    Provides access via JSON interface. Requests are sent through a single
+    ``requests.Session`` so the HTTP connection to the server is kept alive
+    and reused. Call :meth:`close` to release it.
 
     """
 
@@ -42,30 +43,62 @@ class LMSServer():
         self.web = f"http://{host}:{port}/"
         self.url = f"http://{host}:{port}/jsonrpc.js"
         self.players = None
+        self._session = None
 
-    def request(self, player="", params=None):
+    @property
+    def session(self) -> requests.Session:
+        """
+        :rtype: requests.Session
+        :returns: HTTP session used for all requests to the server
+
+        The session is created on first use.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def close(self):
+        """Close the HTTP session. A new one is created by the next request."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def build_payload(self, player="", params=None) -> dict:
         """
         :type player: (str)
-        :param player: MAC address of a connected player. Alternatively, 
+        :param player: MAC address of a connected player. Alternatively,
                        "-" can be used for server level requests.
         :type params: (str, list)
         :param params: Request command
+        :rtype: dict
+        :returns: JSON-RPC payload to be posted to the server url
 
+        Build the payload for a request. This is shared by the synchronous and
+        asynchronous clients.
         """
         if params is None:
             params = []
 
-        LOG.debug('server request: %s %s %s', self.url, player, params)
+        return {"id": self.id,
+                "method": "slim.request",
+                "params": [player, params]}
 
-        cmd = [player, params]
+    def request(self, player="", params=None):
+        """
+        :type player: (str)
+        :param player: MAC address of a connected player. Alternatively, 
+                       "-" can be used for server level requests.
+        :type params: (str, list)
+        :param params: Request command
 
-        payload = {"id": self.id,
-                "method": "slim.request",
-                "params": cmd}
+        """
+        LOG.debug('server request: %s %s %s', self.url, player, params)
+
+        payload = self.build_payload(player, params)
 
         LOG.debug('Request payload: %s', payload)
         try:
-            response = requests.post(url=self.url, json=payload, timeout=10)
+            response = self.session.post(url=self.url, json=payload, timeout=10)
         except requests.exceptions.ConnectTimeout as err:
             raise LMSConnectionError("Could not connect to server.") from err
         except requests.exceptions.ConnectionError as err:
@@ -91,11 +124,7 @@ class LMSServer():
              LMSPlayer: elParaguayo's Laptop (42:42:42:42:42:42)]
 
         """
-        self.players = []
-        player_count = self.get_player_count()
-        for i in range(player_count):
-            player = LMSPlayer.from_index(i, self)
-            self.players.append(player)
+        self.players = LMSPlayer.all_players(self)
         return self.players
 
     def get_player_count(self) -> int: